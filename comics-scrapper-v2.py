@@ -6,12 +6,31 @@ Fixed and cleaned up version
 
 import os
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
 import argparse
 import re
+import shutil
 import json
-from urllib.parse import quote
+from urllib.parse import quote, urlparse
 import logging
+from pathlib import Path
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import requests_cache
+except ImportError:  # Optional: pages are simply re-fetched every run
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:  # Optional: JSON is written with the stdlib encoder
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -21,7 +40,22 @@ logger = logging.getLogger(__name__)
 
 # Constants
 BASE_URL = "https://getcomics.org/page/{}/?s={}"
-DOWNLOAD_DIR = "~/Downloads/"
+DOWNLOAD_DIR = Path("~/Downloads").expanduser()
+LINK_WORKERS = 8  # Concurrent detail page fetches
+DOWNLOAD_WORKERS = 4  # Concurrent file downloads
+COPY_BUFFER_SIZE = 1024 * 1024  # Bytes per read/write when saving downloads
+RATE_LIMIT = 10  # Requests per second, shared by all workers
+MAX_429_RETRIES = 5
+BACKOFF_BASE = 1.0  # Seconds
+CACHE_EXPIRE_AFTER = 24 * 60 * 60  # Seconds to keep cached pages
+
+ARCHIVE_EXTENSIONS = (".zip", ".cbr", ".cbz", ".rar")  # Kept when the URL names one
+
+# Filename sanitizing helpers, built once
+INVALID_FILENAME_CHARS = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+WHITESPACE = re.compile(r"\s+")
+
+CONTENT_RANGE_SIZE = re.compile(r"bytes \*/(\d+)")  # As sent with a 416
 
 HEADERS = {
     "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9",
@@ -37,11 +71,139 @@ HEADERS = {
 }
 
 
+# Shared session so repeated requests to getcomics.org reuse one keep-alive
+# connection instead of paying a TCP + TLS handshake per page. With
+# requests-cache installed, listing and comic pages are also cached on disk;
+# file downloads (getcomics.org/dls and external mirrors) never are.
+if requests_cache is not None:
+    SESSION = requests_cache.CachedSession(
+        "comics_cache",
+        backend="sqlite",
+        use_cache_dir=True,
+        allowable_methods=("GET",),
+        expire_after=requests_cache.DO_NOT_CACHE,
+        urls_expire_after={
+            "getcomics.org/dls": requests_cache.DO_NOT_CACHE,
+            "getcomics.org": CACHE_EXPIRE_AFTER,
+        },
+    )
+else:
+    SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    # One kept-alive connection per worker, so none is opened and then dropped
+    pool_maxsize=max(LINK_WORKERS, DOWNLOAD_WORKERS),
+    # 429s, with or without Retry-After, are left to http_request() so they
+    # go through the rate limiter and jittered backoff
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],
+        respect_retry_after_header=False,
+    ),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+
+def get_session():
+    """Return the shared HTTP session (tests may replace SESSION)"""
+    return SESSION
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` requests per second"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available and take it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+RATE_LIMITER = RateLimiter(RATE_LIMIT)
+
+
+def parse_retry_after(response):
+    """Return the Retry-After delay in seconds, if the server sent a valid one"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def http_request(method, url, **kwargs):
+    """Send a request through the shared session, rate limited and retried on 429"""
+    for attempt in range(MAX_429_RETRIES + 1):
+        RATE_LIMITER.acquire()
+        response = get_session().request(method, url, **kwargs)
+        if response.status_code != 429 or attempt == MAX_429_RETRIES:
+            return response
+
+        response.close()
+        delay = parse_retry_after(response)
+        if delay is None:
+            # Exponential backoff with 1-2x jitter so workers don't retry in step
+            delay = (1 + random.random()) * 2**attempt * BACKOFF_BASE
+        logger.warning(f"Rate limited on {url}, retrying in {delay:.1f}s")
+        time.sleep(delay)
+
+
+def http_get(url, **kwargs):
+    """GET through the shared session, rate limited and retried on HTTP 429"""
+    return http_request("GET", url, **kwargs)
+
+
+def remote_size(link):
+    """Return the size a HEAD request reports for link, or 0 if unknown"""
+    try:
+        head = http_request("HEAD", link, allow_redirects=True, timeout=10)
+    except requests.exceptions.RequestException:
+        return 0
+    if not head.ok:
+        return 0
+    return int(head.headers.get("content-length", 0))
+
+
+def unsatisfied_range_size(response):
+    """Return the size a 416 response's Content-Range reports, or 0 if unknown"""
+    match = CONTENT_RANGE_SIZE.fullmatch(response.headers.get("content-range", ""))
+    return int(match.group(1)) if match else 0
+
+
 def write_to_json(json_dict, filename):
     """Write dictionary to JSON file"""
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(json_dict, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(json_dict, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(json_dict, f, indent=2, ensure_ascii=False)
         logger.info(f"Successfully wrote {len(json_dict)} entries to {filename}")
     except Exception as e:
         logger.error(f"Error writing to JSON file: {e}")
@@ -50,20 +212,28 @@ def write_to_json(json_dict, filename):
 def sanitize_filename(filename):
     """Sanitize filename by removing/replacing invalid characters"""
     # Remove or replace invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', "_", filename)
+    filename = filename.translate(INVALID_FILENAME_CHARS)
     # Remove extra whitespace
-    filename = re.sub(r"\s+", " ", filename).strip()
+    filename = WHITESPACE.sub(" ", filename).strip()
     # Limit length
     if len(filename) > 200:
         filename = filename[:200]
     return filename
 
 
+def target_filename(link, title):
+    """Name a comic is saved under, keeping the archive type from the URL path"""
+    extension = os.path.splitext(urlparse(link).path)[1].lower()
+    if extension not in ARCHIVE_EXTENSIONS:
+        extension = ".cbr"
+    return sanitize_filename(title) + extension
+
+
 def create_download_dir():
     """Create download directory if it doesn't exist"""
-    if not os.path.exists(DOWNLOAD_DIR):
+    if not DOWNLOAD_DIR.exists():
         try:
-            os.makedirs(DOWNLOAD_DIR)
+            DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
             logger.info(f"Created download directory: {DOWNLOAD_DIR}")
         except Exception as e:
             logger.error(f"Could not create download directory: {e}")
@@ -74,37 +244,61 @@ def create_download_dir():
 def download_file(link, filename):
     """Download file from given link"""
     try:
-        if not create_download_dir():
-            return False
-
-        # Sanitize filename
-        filename = sanitize_filename(filename)
+        filename = target_filename(link, filename)
 
-        # Determine file extension
-        if ".zip" in link.lower():
-            filename += ".zip"
-        else:
-            filename += ".cbr"
-
-        filepath = os.path.join(DOWNLOAD_DIR, filename)
+        filepath = DOWNLOAD_DIR / filename
+        part_path = DOWNLOAD_DIR / f"{filename}.part"
 
         # Check if file already exists
-        if os.path.exists(filepath):
+        if filepath.exists():
             logger.info(f"File already exists: {filename}")
             return True
 
-        logger.info(f"Downloading: {filename}")
+        # Ask for the size first so an interrupted download can be resumed
+        total_size = remote_size(link)
+        start = part_path.stat().st_size if part_path.exists() else 0
+        if total_size and start > total_size:
+            start = 0  # The remote file changed, start over
+        if total_size and start == total_size:
+            part_path.replace(filepath)
+            logger.info(f"Successfully downloaded: {filename}")
+            return True
+
+        headers = {"Range": f"bytes={start}-"} if start else {}
+
+        if start:
+            logger.info(f"Resuming: {filename} from byte {start}")
+        else:
+            logger.info(f"Downloading: {filename}")
 
         # Download with streaming for large files
-        with requests.get(
-            link, headers=HEADERS, allow_redirects=True, stream=True
-        ) as r:
+        r = http_get(link, allow_redirects=True, stream=True, headers=headers)
+
+        # The range starts past the end: the .part is complete if it matches
+        # the size the server reports, and stale otherwise
+        if start and r.status_code == 416:
+            r.close()
+            if unsatisfied_range_size(r) == start:
+                part_path.replace(filepath)
+                logger.info(f"Successfully downloaded: {filename}")
+                return True
+
+            logger.info(f"Discarding stale partial download: {filename}")
+            part_path.unlink()
+            r = http_get(link, allow_redirects=True, stream=True)
+
+        with r:
             r.raise_for_status()
 
-            with open(filepath, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # 206 means the server honoured the range; anything else restarts
+            resumed = r.status_code == 206
+
+            with open(part_path, "ab" if resumed else "wb") as f:
+                # Copy in large blocks instead of looping over small chunks
+                r.raw.decode_content = True
+                shutil.copyfileobj(r.raw, f, length=COPY_BUFFER_SIZE)
 
+        part_path.replace(filepath)
         logger.info(f"Successfully downloaded: {filename}")
         return True
 
@@ -116,32 +310,52 @@ def download_file(link, filename):
         return False
 
 
+def articles_fragment(content):
+    """Slice a listing page from its main column to the last </article>
+
+    Starting at <main> rather than the first "<article" keeps the tag text in
+    head scripts or comments from opening a stray article.
+    """
+    start = content.find(b"<main")
+    end = content.rfind(b"</article>")
+    if start == -1 or end == -1:
+        return content
+    return content[start : end + len(b"</article>")]
+
+
+def download_button_fragment(content):
+    """Slice a comic page from its download button div onwards
+
+    Returns an empty fragment when the page has no download button at all.
+    """
+    marker = content.find(b"aio-button-center")
+    if marker == -1:
+        return b""
+    start = content.rfind(b"<div", 0, marker)
+    return content[start:] if start != -1 else content
+
+
 def extract_download_link(page_url):
     """Extract download link from comic page"""
     try:
-        response = requests.get(page_url, headers=HEADERS, timeout=10)
+        response = http_get(page_url, timeout=10)
         response.raise_for_status()
 
-        page_parsed = BeautifulSoup(response.content, "html.parser")
-
-        # Look for download button
-        download_divs = page_parsed.find_all("div", {"class": "aio-button-center"})
-        if not download_divs:
+        # Only parse from the download button onwards, skipping the page header
+        button_html = download_button_fragment(response.content)
+        download_div = LexborHTMLParser(button_html).css_first("div.aio-button-center")
+        if download_div is None:
             logger.warning(f"No download button found on {page_url}")
             return None
 
-        download_button = str(download_divs[0])
-
-        # Extract download link using regex
-        link_pattern = re.compile(r"https://[a-zA-Z0-9./%\-=+:?&_]+")
-        links = link_pattern.findall(download_button)
-
-        if links:
-            return links[0]
-        else:
+        # Read the link straight from the anchor's href
+        anchor = download_div.css_first("a[href^='https://']")
+        if anchor is None:
             logger.warning(f"No download link found in button on {page_url}")
             return None
 
+        return anchor.attributes["href"]
+
     except requests.exceptions.RequestException as e:
         logger.error(f"Network error accessing {page_url}: {e}")
         return None
@@ -156,55 +370,77 @@ def getcomic_downloader(page, search_term):
         search_url = BASE_URL.format(page, search_term)
         logger.info(f"Scraping page {page}: {search_url}")
 
-        response = requests.get(search_url, headers=HEADERS, timeout=10)
+        response = http_get(search_url, timeout=10)
         response.raise_for_status()
 
-        parsed_data = BeautifulSoup(response.content, "html.parser")
-        posts_lists = parsed_data.find_all("article")
+        listing_html = articles_fragment(response.content)
+        posts_lists = LexborHTMLParser(listing_html).css("article")
 
         if not posts_lists:
             logger.warning(f"No articles found on page {page}")
             return {}
 
-        page_links = {}
+        posts = []
 
         for post in posts_lists:
             try:
-                # Extract comic page URL and title
-                links = post.find_all("a")
-                if len(links) < 3:
+                # Extract comic page URL and title in a single traversal
+                nodes = post.css("a, h1")
+                links = [node for node in nodes if node.tag == "a"]
+                heading_node = next((node for node in nodes if node.tag == "h1"), None)
+                if len(links) < 3 or heading_node is None:
                     continue
 
-                page_url = links[2].get("href")
+                page_url = links[2].attributes.get("href")
 
-                headings = post.find_all("h1")
-                if not headings:
-                    continue
-
-                heading = headings[0].text.strip()
+                heading = heading_node.text().strip()
 
                 if not page_url or not heading:
                     continue
 
-                logger.info(f"Processing: {heading}")
+                posts.append((heading, page_url))
 
-                # Extract download link
-                download_link = extract_download_link(page_url)
+            except Exception as e:
+                logger.error(f"Error processing post: {e}")
+                continue
 
-                if download_link:
-                    page_links[heading] = download_link
+        # Fetch the detail pages concurrently; the work is network bound
+        with ThreadPoolExecutor(max_workers=LINK_WORKERS) as pool:
+            download_links = list(
+                pool.map(extract_download_link, [url for _, url in posts])
+            )
 
-                    # Download the file
-                    if download_file(download_link, heading):
+        page_links = {}
+
+        for (heading, _), download_link in zip(posts, download_links):
+            logger.info(f"Processing: {heading}")
+
+            if download_link:
+                page_links[heading] = download_link
+            else:
+                logger.warning(f"No download link found for: {heading}")
+
+        # Headings that sanitize to the same file share one download, so two
+        # workers never write the same .part file at once
+        targets = {}
+        for heading, download_link in page_links.items():
+            filename = target_filename(download_link, heading)
+            targets.setdefault(filename, []).append(heading)
+
+        # Download the files, at most DOWNLOAD_WORKERS at a time
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+            futures = {}
+            for headings in targets.values():
+                heading = headings[0]
+                future = pool.submit(download_file, page_links[heading], heading)
+                futures[future] = headings
+            for future in as_completed(futures):
+                succeeded = future.result()
+                for heading in futures[future]:
+                    if succeeded:
                         logger.info(f"Successfully processed: {heading}")
                     else:
                         logger.error(f"Failed to download: {heading}")
-                else:
-                    logger.warning(f"No download link found for: {heading}")
-
-            except Exception as e:
-                logger.error(f"Error processing post: {e}")
-                continue
 
         return page_links
 
@@ -236,6 +472,12 @@ def main():
         logger.error("Search term cannot be empty")
         return
 
+    # The download directory is resolved and created once, up front
+    global DOWNLOAD_DIR
+    DOWNLOAD_DIR = DOWNLOAD_DIR.resolve()
+    if not create_download_dir():
+        return
+
     # URL encode the search term
     encoded_search = quote(args.search)
     logger.info(f"Starting scraper for '{args.search}' across {args.pages} pages")
@@ -5,15 +5,36 @@ Allows user to choose which comics to download
 """
 
 import os
+import functools
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
 import argparse
 import re
+import shutil
 import json
-from urllib.parse import quote
+from urllib.parse import quote, urlparse
 import logging
+from pathlib import Path
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Tuple, Optional
 
+try:
+    import requests_cache
+except ImportError:  # Optional: pages are simply re-fetched every run
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:  # Optional: JSON is written with the stdlib encoder
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -23,6 +44,23 @@ logger = logging.getLogger(__name__)
 # Constants
 BASE_URL = "https://getcomics.org/page/{}/?s={}"
 DOWNLOAD_DIR = None  # Will be set based on user choice
+LINK_WORKERS = 8  # Concurrent detail page fetches
+DOWNLOAD_CONCURRENCY = 2  # Parallel downloads to start with
+MAX_DOWNLOAD_CONCURRENCY = 16
+CHUNK_SIZE = 64 * 1024
+COPY_BUFFER_SIZE = 1024 * 1024  # Bytes per read/write when saving downloads
+RATE_LIMIT = 10  # Requests per second, shared by all workers
+MAX_429_RETRIES = 5
+BACKOFF_BASE = 1.0  # Seconds
+CACHE_EXPIRE_AFTER = 24 * 60 * 60  # Seconds to keep cached pages
+
+ARCHIVE_EXTENSIONS = (".zip", ".cbr", ".cbz", ".rar")  # Kept when the URL names one
+
+# Filename sanitizing helpers, built once
+INVALID_FILENAME_CHARS = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+WHITESPACE = re.compile(r"\s+")
+
+CONTENT_RANGE_SIZE = re.compile(r"bytes \*/(\d+)")  # As sent with a 416
 
 HEADERS = {
     "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9",
@@ -38,25 +76,239 @@ HEADERS = {
 }
 
 
+# Shared session so repeated requests to getcomics.org reuse one keep-alive
+# connection instead of paying a TCP + TLS handshake per page. With
+# requests-cache installed, listing and comic pages are also cached on disk;
+# file downloads (getcomics.org/dls and external mirrors) never are.
+if requests_cache is not None:
+    SESSION = requests_cache.CachedSession(
+        "comics_cache",
+        backend="sqlite",
+        use_cache_dir=True,
+        allowable_methods=("GET",),
+        expire_after=requests_cache.DO_NOT_CACHE,
+        urls_expire_after={
+            "getcomics.org/dls": requests_cache.DO_NOT_CACHE,
+            "getcomics.org": CACHE_EXPIRE_AFTER,
+        },
+    )
+else:
+    SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    # One kept-alive connection per worker, so none is opened and then dropped
+    pool_maxsize=max(LINK_WORKERS, MAX_DOWNLOAD_CONCURRENCY),
+    # 429s, with or without Retry-After, are left to http_request() so they
+    # go through the rate limiter and jittered backoff
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],
+        respect_retry_after_header=False,
+    ),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+
+def get_session() -> requests.Session:
+    """Return the shared HTTP session (tests may replace SESSION)"""
+    return SESSION
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` requests per second"""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available and take it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+RATE_LIMITER = RateLimiter(RATE_LIMIT)
+
+# Per-thread view of the latest response: time to headers and whether any
+# request was answered with 429
+REQUEST_STATS = threading.local()
+
+
+class AdaptiveLimiter:
+    """Concurrency cap that grows while responses stay fast and halves on trouble
+
+    Works like TCP congestion control: after a full window of completions
+    with no 429 and no slowdown the cap grows by one, and a 429 or a
+    response time above twice the baseline halves it. Requests already
+    running at a cut cannot cut again, and the baseline is the best
+    response time since the last cut.
+    """
+
+    def __init__(self, start: int, minimum: int = 1, maximum: int = 16):
+        self.limit = start
+        self.minimum = minimum
+        self.maximum = maximum
+        self.active = 0
+        self.completed = 0
+        self.ewma_rtt = None
+        self.best_rtt = None
+        self.started_before_cut = 0
+        self.cond = threading.Condition()
+
+    def acquire(self) -> None:
+        """Block until a slot is free under the current cap"""
+        with self.cond:
+            while self.active >= self.limit:
+                self.cond.wait()
+            self.active += 1
+
+    def release(self, rtt: Optional[float], throttled: bool) -> None:
+        """Free a slot and adjust the cap from the finished request"""
+        with self.cond:
+            self.active -= 1
+            after_cut = self.started_before_cut == 0
+            if not after_cut:
+                self.started_before_cut -= 1
+            if rtt is not None:
+                self.ewma_rtt = (
+                    rtt if self.ewma_rtt is None else 0.3 * rtt + 0.7 * self.ewma_rtt
+                )
+                if self.best_rtt is None or self.ewma_rtt < self.best_rtt:
+                    self.best_rtt = self.ewma_rtt
+
+            if throttled or (rtt is not None and self.ewma_rtt > 2 * self.best_rtt):
+                # Requests started before a cut report the same trouble, so
+                # only a request started after it can cut again
+                if after_cut:
+                    self._set_limit(self.limit // 2)
+                    self.started_before_cut = self.active
+                    # Judge later slowdowns against current response times
+                    self.best_rtt = self.ewma_rtt
+            else:
+                self.completed += 1
+                if self.completed >= self.limit:
+                    self._set_limit(self.limit + 1)
+            self.cond.notify_all()
+
+    def _set_limit(self, limit: int) -> None:
+        limit = max(self.minimum, min(self.maximum, limit))
+        self.completed = 0
+        if limit != self.limit:
+            logger.info(f"Download concurrency: {self.limit} -> {limit}")
+            self.limit = limit
+
+
+def parse_retry_after(response: requests.Response) -> Optional[float]:
+    """Return the Retry-After delay in seconds, if the server sent a valid one"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def http_request(method: str, url: str, **kwargs) -> requests.Response:
+    """Send a request through the shared session, rate limited and retried on 429"""
+    for attempt in range(MAX_429_RETRIES + 1):
+        RATE_LIMITER.acquire()
+        response = get_session().request(method, url, **kwargs)
+        REQUEST_STATS.rtt = response.elapsed.total_seconds()
+        if response.status_code != 429 or attempt == MAX_429_RETRIES:
+            return response
+
+        REQUEST_STATS.throttled = True
+        response.close()
+        delay = parse_retry_after(response)
+        if delay is None:
+            # Exponential backoff with 1-2x jitter so workers don't retry in step
+            delay = (1 + random.random()) * 2**attempt * BACKOFF_BASE
+        logger.warning(f"Rate limited on {url}, retrying in {delay:.1f}s")
+        time.sleep(delay)
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """GET through the shared session, rate limited and retried on HTTP 429"""
+    return http_request("GET", url, **kwargs)
+
+
+def remote_size(link: str) -> int:
+    """Return the size a HEAD request reports for link, or 0 if unknown"""
+    try:
+        head = http_request("HEAD", link, allow_redirects=True, timeout=10)
+    except requests.exceptions.RequestException:
+        return 0
+    if not head.ok:
+        return 0
+    return int(head.headers.get("content-length", 0))
+
+
+def unsatisfied_range_size(response: requests.Response) -> int:
+    """Return the size a 416 response's Content-Range reports, or 0 if unknown"""
+    match = CONTENT_RANGE_SIZE.fullmatch(response.headers.get("content-range", ""))
+    return int(match.group(1)) if match else 0
+
+
+class ProgressWriter:
+    """File wrapper that prints download progress as blocks are written"""
+
+    def __init__(self, f, downloaded: int, total_size: int):
+        self.f = f
+        self.downloaded = downloaded
+        self.total_size = total_size
+
+    def write(self, data: bytes) -> int:
+        written = self.f.write(data)
+        self.downloaded += written
+        progress = (self.downloaded / self.total_size) * 100
+        print(f"\rProgress: {progress:.1f}%", end="", flush=True)
+        return written
+
+
+@dataclass(slots=True)
 class Comic:
     """Represents a comic with its metadata"""
 
-    def __init__(self, title: str, page_url: str, download_link: str = None):
-        self.title = title
-        self.page_url = page_url
-        self.download_link = download_link
-        self.downloaded = False
+    title: str
+    page_url: str
+    download_link: Optional[str] = None
+    downloaded: bool = False
 
     def __str__(self):
         status = "✓" if self.downloaded else "○"
         return f"[{status}] {self.title}"
 
 
-def write_to_json(comics_dict: Dict[str, str], filename: str) -> None:
+def write_to_json(comics_dict: Dict[str, str], filename: Path) -> None:
     """Write dictionary to JSON file"""
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(comics_dict, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(comics_dict, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(comics_dict, f, indent=2, ensure_ascii=False)
         logger.info(f"Successfully wrote {len(comics_dict)} entries to {filename}")
     except Exception as e:
         logger.error(f"Error writing to JSON file: {e}")
@@ -64,21 +316,29 @@ def write_to_json(comics_dict: Dict[str, str], filename: str) -> None:
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename by removing/replacing invalid characters"""
-    filename = re.sub(r'[<>:"/\\|?*]', "_", filename)
-    filename = re.sub(r"\s+", " ", filename).strip()
+    filename = filename.translate(INVALID_FILENAME_CHARS)
+    filename = WHITESPACE.sub(" ", filename).strip()
     if len(filename) > 200:
         filename = filename[:200]
     return filename
 
 
-def create_download_dir(download_path: str = None) -> bool:
+def target_filename(link: str, title: str) -> str:
+    """Name a comic is saved under, keeping the archive type from the URL path"""
+    extension = os.path.splitext(urlparse(link).path)[1].lower()
+    if extension not in ARCHIVE_EXTENSIONS:
+        extension = ".cbr"
+    return sanitize_filename(title) + extension
+
+
+def create_download_dir(download_path: Path = None) -> bool:
     """Create download directory if it doesn't exist"""
     if download_path is None:
         download_path = DOWNLOAD_DIR
 
-    if not os.path.exists(download_path):
+    if not download_path.exists():
         try:
-            os.makedirs(download_path)
+            download_path.mkdir(parents=True, exist_ok=True)
             logger.info(f"Created download directory: {download_path}")
         except Exception as e:
             logger.error(f"Could not create download directory: {e}")
@@ -122,51 +382,75 @@ def download_file(link: str, filename: str, download_dir: str = None) -> bool:
     """Download file from given link"""
 
 
-def download_file(link: str, filename: str, download_dir: str = None) -> bool:
+def download_file(
+    link: str, filename: str, download_dir: Path = None, show_progress: bool = True
+) -> bool:
     """Download file from given link"""
     try:
         if download_dir is None:
             download_dir = DOWNLOAD_DIR
 
-        if not create_download_dir(download_dir):
-            return False
+        filename = target_filename(link, filename)
+        filepath = download_dir / filename
+        part_path = download_dir / f"{filename}.part"
+
+        if filepath.exists():
+            logger.info(f"File already exists: {filename}")
+            return True
+
+        # Ask for the size first so an interrupted download can be resumed
+        total_size = remote_size(link)
+        start = part_path.stat().st_size if part_path.exists() else 0
+        if total_size and start > total_size:
+            start = 0  # The remote file changed, start over
+        if total_size and start == total_size:
+            part_path.replace(filepath)
+            logger.info(f"Successfully downloaded: {filename}")
+            return True
 
-        filename = sanitize_filename(filename)
+        headers = {"Range": f"bytes={start}-"} if start else {}
 
-        if ".zip" in link.lower():
-            filename += ".zip"
+        if start:
+            logger.info(f"Resuming: {filename} from byte {start}")
         else:
-            filename += ".cbr"
+            logger.info(f"Downloading: {filename}")
 
-        filepath = os.path.join(download_dir, filename)
+        r = http_get(link, allow_redirects=True, stream=True, headers=headers)
 
-        if os.path.exists(filepath):
-            logger.info(f"File already exists: {filename}")
-            return True
+        # The range starts past the end: the .part is complete if it matches
+        # the size the server reports, and stale otherwise
+        if start and r.status_code == 416:
+            r.close()
+            if unsatisfied_range_size(r) == start:
+                part_path.replace(filepath)
+                logger.info(f"Successfully downloaded: {filename}")
+                return True
 
-        logger.info(f"Downloading: {filename}")
+            logger.info(f"Discarding stale partial download: {filename}")
+            part_path.unlink()
+            r = http_get(link, allow_redirects=True, stream=True)
 
-        with requests.get(
-            link, headers=HEADERS, allow_redirects=True, stream=True
-        ) as r:
+        with r:
             r.raise_for_status()
 
-            total_size = int(r.headers.get("content-length", 0))
-            downloaded = 0
+            # 206 means the server honoured the range; anything else restarts
+            downloaded = start if r.status_code == 206 else 0
+            if not total_size:
+                total_size = downloaded + int(r.headers.get("content-length", 0))
 
-            with open(filepath, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    downloaded += len(chunk)
+            # Show progress for large files
+            show_bar = show_progress and total_size > 1024 * 1024  # > 1MB
 
-                    # Show progress for large files
-                    if total_size > 1024 * 1024:  # > 1MB
-                        progress = (downloaded / total_size) * 100
-                        print(f"\rProgress: {progress:.1f}%", end="", flush=True)
+            with open(part_path, "ab" if downloaded else "wb") as f:
+                # Copy in large blocks instead of looping over small chunks
+                r.raw.decode_content = True
+                target = ProgressWriter(f, downloaded, total_size) if show_bar else f
+                shutil.copyfileobj(r.raw, target, length=COPY_BUFFER_SIZE)
 
-            if total_size > 1024 * 1024:
+            if show_bar:
                 print()  # New line after progress
 
+        part_path.replace(filepath)
         logger.info(f"Successfully downloaded: {filename}")
         return True
 
@@ -178,29 +462,59 @@ def download_file(link: str, filename: str, download_dir: str = None) -> bool:
         return False
 
 
-def extract_download_link(page_url: str) -> Optional[str]:
-    """Extract download link from comic page"""
-    try:
-        response = requests.get(page_url, headers=HEADERS, timeout=10)
-        response.raise_for_status()
+def articles_fragment(content: bytes) -> bytes:
+    """Slice a listing page from its main column to the last </article>
 
-        page_parsed = BeautifulSoup(response.content, "html.parser")
+    Starting at <main> rather than the first "<article" keeps the tag text in
+    head scripts or comments from opening a stray article.
+    """
+    start = content.find(b"<main")
+    end = content.rfind(b"</article>")
+    if start == -1 or end == -1:
+        return content
+    return content[start : end + len(b"</article>")]
 
-        download_divs = page_parsed.find_all("div", {"class": "aio-button-center"})
-        if not download_divs:
-            logger.warning(f"No download button found on {page_url}")
-            return None
 
-        download_button = str(download_divs[0])
+def download_button_fragment(content: bytes) -> bytes:
+    """Slice a comic page from its download button div onwards
 
-        link_pattern = re.compile(r"https://[a-zA-Z0-9./%\-=+:?&_]+")
-        links = link_pattern.findall(download_button)
+    Returns an empty fragment when the page has no download button at all.
+    """
+    marker = content.find(b"aio-button-center")
+    if marker == -1:
+        return b""
+    start = content.rfind(b"<div", 0, marker)
+    return content[start:] if start != -1 else content
 
-        if links:
-            return links[0]
-        else:
-            logger.warning(f"No download link found in button on {page_url}")
-            return None
+
+@functools.lru_cache(maxsize=256)
+def fetch_download_link(page_url: str) -> Optional[str]:
+    """Fetch a comic page and return its download link, memoized by URL
+
+    Errors propagate instead of returning None so failed lookups are not cached.
+    """
+    response = http_get(page_url, timeout=10)
+    response.raise_for_status()
+
+    # Only parse from the download button onwards, skipping the page header
+    button_html = download_button_fragment(response.content)
+    download_div = LexborHTMLParser(button_html).css_first("div.aio-button-center")
+    if download_div is None:
+        logger.warning(f"No download button found on {page_url}")
+        return None
+
+    anchor = download_div.css_first("a[href^='https://']")
+    if anchor is None:
+        logger.warning(f"No download link found in button on {page_url}")
+        return None
+
+    return anchor.attributes["href"]
+
+
+def extract_download_link(page_url: str) -> Optional[str]:
+    """Extract download link from comic page"""
+    try:
+        return fetch_download_link(page_url)
 
     except requests.exceptions.RequestException as e:
         logger.error(f"Network error accessing {page_url}: {e}")
@@ -210,51 +524,82 @@ def extract_download_link(page_url: str) -> Optional[str]:
         return None
 
 
-def search_comics(search_term: str, max_results: int = 20) -> List[Comic]:
-    """Search for comics and return list of Comic objects, stopping at max_results"""
-    all_comics = []
-    encoded_search = quote(search_term)
-    page = 1
+def fetch_listing_page(url: str, needed: Optional[int] = None) -> Tuple[bytes, bool]:
+    """Stream a listing page, stopping once `needed` articles have arrived
 
-    while len(all_comics) < max_results:
+    Returns the bytes read and whether articles may have been left unread.
+    """
+    end_tag = b"</article>"
+    body = bytearray()
+    articles = 0
+
+    with http_get(url, timeout=10, stream=True) as response:
+        response.raise_for_status()
+
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            # Rescan the tail of the previous chunk in case a tag was split
+            scan_from = max(0, len(body) - len(end_tag) + 1)
+            body += chunk
+            articles += body.count(end_tag, scan_from)
+
+            if needed is not None and articles >= needed:
+                return bytes(body), True
+            if body.find(b"</main>", scan_from) != -1:
+                break  # Everything after the main column is page chrome
+
+    return bytes(body), False
+
+
+def parse_listing(content: bytes) -> List[Comic]:
+    """Parse the comics out of a listing page"""
+    listing_html = articles_fragment(content)
+    page_comics = []
+
+    for post in LexborHTMLParser(listing_html).css("article"):
         try:
-            search_url = BASE_URL.format(page, encoded_search)
-            logger.info(f"Searching page {page}: {search_url}")
+            # One traversal collects anchors and headings in document order
+            nodes = post.css("a, h1")
+            links = [node for node in nodes if node.tag == "a"]
+            heading_node = next((node for node in nodes if node.tag == "h1"), None)
+            if len(links) < 3 or heading_node is None:
+                continue
 
-            response = requests.get(search_url, headers=HEADERS, timeout=10)
-            response.raise_for_status()
+            page_url = links[2].attributes.get("href")
 
-            parsed_data = BeautifulSoup(response.content, "html.parser")
-            posts_lists = parsed_data.find_all("article")
+            heading = heading_node.text().strip()
 
-            if not posts_lists:
-                logger.warning(f"No articles found on page {page}")
-                break  # No more results
+            if not page_url or not heading:
+                continue
 
-            page_comics = []
-            for post in posts_lists:
-                try:
-                    links = post.find_all("a")
-                    if len(links) < 3:
-                        continue
+            page_comics.append(Comic(heading, page_url))
 
-                    page_url = links[2].get("href")
+        except Exception as e:
+            logger.error(f"Error processing post: {e}")
+            continue
 
-                    headings = post.find_all("h1")
-                    if not headings:
-                        continue
+    return page_comics
 
-                    heading = headings[0].text.strip()
 
-                    if not page_url or not heading:
-                        continue
+def search_comics(search_term: str, max_results: int = 20) -> List[Comic]:
+    """Search for comics and return list of Comic objects, stopping at max_results"""
+    all_comics = []
+    encoded_search = quote(search_term)
+    page = 1
 
-                    comic = Comic(heading, page_url)
-                    page_comics.append(comic)
+    while len(all_comics) < max_results:
+        try:
+            search_url = BASE_URL.format(page, encoded_search)
+            logger.info(f"Searching page {page}: {search_url}")
+
+            # Only read as much of the page as the remaining results need
+            needed = max_results - len(all_comics)
+            content, truncated = fetch_listing_page(search_url, needed)
+            page_comics = parse_listing(content)
 
-                except Exception as e:
-                    logger.error(f"Error processing post: {e}")
-                    continue
+            if truncated and len(page_comics) < needed:
+                # Some articles were unusable, so the rest of the page is needed
+                content, _ = fetch_listing_page(search_url)
+                page_comics = parse_listing(content)
 
             if not page_comics:
                 logger.warning(f"No valid comics found on page {page}")
@@ -361,37 +706,94 @@ def get_user_selection(comics: List[Comic]) -> List[int]:
             print("Invalid input format. Please try again.")
 
 
+def download_with_limiter(
+    limiter: AdaptiveLimiter, comic: Comic, download_dir: Path, show_progress: bool
+) -> bool:
+    """Download a comic once the limiter allows, then report how it went"""
+    limiter.acquire()
+    REQUEST_STATS.rtt = None
+    REQUEST_STATS.throttled = False
+    try:
+        return download_file(
+            comic.download_link, comic.title, download_dir, show_progress
+        )
+    finally:
+        limiter.release(REQUEST_STATS.rtt, REQUEST_STATS.throttled)
+
+
 def download_selected_comics(
-    comics: List[Comic], selected_indices: List[int], download_dir: str
+    comics: List[Comic],
+    selected_indices: List[int],
+    download_dir: Path,
+    concurrency: Optional[int] = None,
 ) -> None:
-    """Download selected comics"""
+    """Download selected comics, adapting parallelism unless concurrency is pinned"""
     print(f"\nStarting download of {len(selected_indices)} comics...")
     print(f"📁 Download location: {download_dir}")
 
     downloaded_links = {}
 
-    for i, idx in enumerate(selected_indices, 1):
+    # Resolve missing download links up front, fetching detail pages concurrently
+    pending = [comics[idx] for idx in selected_indices if not comics[idx].download_link]
+    if pending:
+        with ThreadPoolExecutor(max_workers=LINK_WORKERS) as pool:
+            for comic, link in zip(
+                pending, pool.map(extract_download_link, [c.page_url for c in pending])
+            ):
+                comic.download_link = link
+
+    # Comics that sanitize to the same file share one download, so two
+    # workers never write the same .part file at once
+    to_download = {}
+    for idx in selected_indices:
         comic = comics[idx]
-        print(f"\n[{i}/{len(selected_indices)}] Processing: {comic.title}")
-
-        # Get download link if not already available
-        if not comic.download_link:
-            comic.download_link = extract_download_link(comic.page_url)
-
         if comic.download_link:
             downloaded_links[comic.title] = comic.download_link
-
-            if download_file(comic.download_link, comic.title, download_dir):
-                comic.downloaded = True
-                print(f"✓ Successfully downloaded: {comic.title}")
-            else:
-                print(f"✗ Failed to download: {comic.title}")
+            filename = target_filename(comic.download_link, comic.title)
+            to_download.setdefault(filename, []).append(comic)
         else:
             print(f"✗ Could not find download link for: {comic.title}")
 
+    # Start small and let the limiter find what the server sustains, unless
+    # the user pinned a value. The per-file progress line only makes sense
+    # when a single download is running
+    if concurrency:
+        limiter = AdaptiveLimiter(concurrency, concurrency, concurrency)
+    else:
+        limiter = AdaptiveLimiter(
+            DOWNLOAD_CONCURRENCY, maximum=MAX_DOWNLOAD_CONCURRENCY
+        )
+    show_progress = len(to_download) == 1
+
+    with ThreadPoolExecutor(max_workers=limiter.maximum) as pool:
+        futures = {
+            pool.submit(
+                download_with_limiter, limiter, group[0], download_dir, show_progress
+            ): group
+            for group in to_download.values()
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            succeeded = future.result()
+            for comic in futures[future]:
+                comic.downloaded = succeeded
+                if succeeded:
+                    print(
+                        f"[{i}/{len(to_download)}] ✓ Successfully downloaded: {comic.title}"
+                    )
+                else:
+                    print(
+                        f"[{i}/{len(to_download)}] ✗ Failed to download: {comic.title}"
+                    )
+
+    if to_download and not concurrency:
+        logger.info(
+            f"Download concurrency settled at {limiter.limit} "
+            f"(use --concurrency to pin it)"
+        )
+
     # Save download links to JSON in the same directory
     if downloaded_links:
-        json_path = os.path.join(download_dir, "downloaded_comics.json")
+        json_path = download_dir / "downloaded_comics.json"
         write_to_json(downloaded_links, json_path)
 
     # Summary
@@ -423,6 +825,14 @@ def main():
         "--cwd", action="store_true", help="Download to current working directory"
     )
     parser.add_argument("--download-dir", type=str, help="Custom download directory")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help=(
+            "Fixed number of parallel downloads, at most "
+            f"{MAX_DOWNLOAD_CONCURRENCY} (default: adapt automatically)"
+        ),
+    )
 
     args = parser.parse_args()
 
@@ -435,6 +845,15 @@ def main():
         logger.error("Max results must be positive")
         return
 
+    if args.concurrency is not None and args.concurrency <= 0:
+        logger.error("Concurrency must be positive")
+        return
+
+    # The connection pool is sized for MAX_DOWNLOAD_CONCURRENCY downloads
+    if args.concurrency is not None and args.concurrency > MAX_DOWNLOAD_CONCURRENCY:
+        logger.error(f"Concurrency cannot exceed {MAX_DOWNLOAD_CONCURRENCY}")
+        return
+
     # Determine download directory
     global DOWNLOAD_DIR
     if args.download_dir:
@@ -446,6 +865,11 @@ def main():
     else:
         DOWNLOAD_DIR = get_download_directory()
 
+    # Resolve and create the directory once instead of on every download
+    DOWNLOAD_DIR = Path(DOWNLOAD_DIR).expanduser().resolve()
+    if not create_download_dir():
+        return
+
     print(
         f"🔍 Searching for '{args.search}' (showing top {args.max_results} results)..."
     )
@@ -463,7 +887,7 @@ def main():
     if args.auto_save:
         search_results = {comic.title: comic.page_url for comic in comics}
         json_filename = f"search_results_{args.search.replace(' ', '_')}.json"
-        json_path = os.path.join(DOWNLOAD_DIR, json_filename)
+        json_path = DOWNLOAD_DIR / json_filename
         write_to_json(search_results, json_path)
 
     # Interactive selection loop
@@ -475,7 +899,9 @@ def main():
             print("👋 Goodbye!")
             break
 
-        download_selected_comics(comics, selected_indices, DOWNLOAD_DIR)
+        download_selected_comics(
+            comics, selected_indices, DOWNLOAD_DIR, args.concurrency
+        )
 
         # Ask if user wants to continue
         continue_choice = (